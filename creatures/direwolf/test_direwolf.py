@@ -136,6 +136,24 @@ class TestDirewolfProtect:
         assert direwolf2.starks_to_protect[0].name == "Rob"
         assert direwolf2.starks_to_protect[1].name == "Bran"
 
+    def test_stark_stays_unsafe_when_protection_is_refused(self):
+        """A Stark turned away by either guard is left unsafe."""
+        direwolf = Direwolf("Summer", "Winterfell")
+        sansa = Stark("Sansa", "Winterfell")
+        rob = Stark("Rob", "Winterfell")
+        bran = Stark("Bran", "Winterfell")
+        john = Stark("John", "King's Landing")
+
+        direwolf.protect(john)
+        direwolf.protect(sansa)
+        direwolf.protect(rob)
+        direwolf.protect(bran)
+
+        assert sansa.safe is True
+        assert rob.safe is True
+        assert bran.safe is False
+        assert john.safe is False
+
 
 @pytest.mark.skip(reason="Complete Medusa first, then unskip this test")
 class TestDirewolfHunting:
@@ -154,6 +172,20 @@ class TestDirewolfHunting:
         direwolf.protect(stark)
         assert direwolf.hunts_white_walkers is False
 
+    def test_direwolf_resumes_hunting_after_leaving(self):
+        """A Direwolf hunts again once it has left every Stark it protected."""
+        direwolf = Direwolf("Nymeria", "Winterfell")
+        sansa = Stark("Sansa")
+        arya = Stark("Arya")
+
+        direwolf.protect(sansa)
+        direwolf.protect(arya)
+        direwolf.leave(sansa)
+        assert direwolf.hunts_white_walkers is False
+
+        direwolf.leave(arya)
+        assert direwolf.hunts_white_walkers is True
+
 
 @pytest.mark.skip(reason="Complete Medusa first, then unskip this test")
 class TestDirewolfLeave:
@@ -165,3 +165,20 @@ class TestFairyHumanWards:
         fairy.replace_infant(third_infant)
 
         assert fairy.disposition == "Good natured"
+
+
+@pytest.mark.skip(reason="Complete Medusa first, then unskip this test")
+class TestFairyMultipleInstances:
+    """Tests ensuring each Fairy has independent clothes."""
+
+    def test_making_dresses_does_not_affect_other_fairies(self):
+        """Each Fairy instance owns its own clothes dict and dresses list."""
+        rose = Fairy("Rose")
+        basil = Fairy("Basil")
+
+        rose.make_dresses(["Daffodil"])
+
+        assert rose.clothes == {"dresses": ["Iris", "Daffodil"]}
+        assert basil.clothes == {"dresses": ["Iris"]}  # Basil made no dresses
+        assert rose.clothes is not basil.clothes
+        assert rose.clothes["dresses"] is not basil.clothes["dresses"]
@@ -152,6 +152,28 @@ class TestOgreSwinging:
         assert ogre.swings == 2
         assert human.knocked_out is True
 
+    def test_ogre_swings_are_counted_across_humans(self):
+        """The Ogre's swing count is shared, while each Human counts their own encounters."""
+        ogre = Ogre("Brak")
+        jane = Human("Jane")
+        tom = Human("Tom")
+
+        ogre.encounter(jane)
+        ogre.encounter(jane)
+        ogre.encounter(jane)
+        assert ogre.swings == 1
+        assert jane.knocked_out is False
+
+        ogre.encounter(tom)
+        ogre.encounter(tom)
+        ogre.encounter(tom)
+
+        assert jane.encounter_counter == 3
+        assert tom.encounter_counter == 3
+        assert ogre.swings == 2
+        assert jane.knocked_out is False
+        assert tom.knocked_out is True
+
 
 @pytest.mark.skip(reason="Complete Medusa first, then unskip this test")
 class TestOgreApologize:
@@ -165,3 +187,16 @@ class TestOgreApologize:
         ogre.apologize(human)
 
         assert human.knocked_out is False
+
+    def test_apologize_wakes_human_knocked_out_by_encounters(self):
+        """A Human knocked out by the swing chain wakes up after an apology."""
+        ogre = Ogre("Brak")
+        human = Human("Jane")
+
+        for _ in range(6):
+            ogre.encounter(human)
+        assert human.knocked_out is True
+
+        ogre.apologize(human)
+
+        assert human.knocked_out is False
@@ -182,6 +182,19 @@ class TestSphinxWrongAnswers:
         assert sphinx.riddles == [riddle2, riddle3]
         assert sphinx.heroes_eaten == 0
 
+    def test_sphinx_answer_matching_is_exact(self):
+        """An answer that differs in case or whitespace counts as wrong."""
+        sphinx = Sphinx()
+        riddle = {
+            "riddle": "What starts with an 'e' and ends with an 'e' and contains one letter?",
+            "answer": "An envelope",
+        }
+        sphinx.collect_riddle(riddle)
+        sphinx.attempt_answer("an envelope")
+        sphinx.attempt_answer("An envelope ")
+        assert sphinx.riddles == [riddle]
+        assert sphinx.heroes_eaten == 2
+
 
 @pytest.mark.skip(reason="Complete Medusa first, then unskip this test")
 class TestSphinxRage: